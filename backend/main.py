@@ -5,17 +5,18 @@ Provides endpoints for debate streaming and TTS generation.
 
 import json
 import logging
+import sys
 from contextlib import asynccontextmanager
 from typing import List, Optional
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse, Response
 from pydantic import BaseModel
 
 from src.config import get_settings
-from src.debate import stream_debate_response, generate_debate_response
-from src.tts import generate_tts, get_available_voices
+from src.debate import stream_debate_response, generate_debate_response, close_client
+from src.tts import generate_tts, get_available_voices, close_http_client
 
 # Configure logging
 settings = get_settings()
@@ -56,6 +57,13 @@ class HealthResponse(BaseModel):
     version: str = "1.0.0"
 
 
+# Media type and Content-Disposition header for each TTS provider's audio
+_AUDIO_FORMATS = {
+    "elevenlabs": ("audio/mpeg", "attachment; filename=audio.mp3"),
+    "pyttsx3": ("audio/wav", "attachment; filename=audio.wav"),
+}
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
@@ -69,6 +77,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("Shutting down Debate Backend")
+    await close_client()
+    await close_http_client()
 
 
 # Initialize FastAPI app
@@ -76,7 +86,8 @@ app = FastAPI(
     title="CPDL Debate Simulator API",
     description="Backend API for LLM streaming and TTS generation",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -107,18 +118,14 @@ async def debate_stream(request: DebateStreamRequest):
     """
     try:
         # Convert pydantic models to dicts
-        messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
+        messages = request.model_dump(include={"messages"})["messages"]
         
-        async def event_generator():
-            async for chunk in stream_debate_response(
+        return StreamingResponse(
+            stream_debate_response(
                 messages=messages,
                 model=request.model,
                 temperature=request.temperature or 0.7
-            ):
-                yield chunk
-        
-        return StreamingResponse(
-            event_generator(),
+            ),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -139,7 +146,7 @@ async def debate_generate(request: DebateResponseRequest):
     Returns the full response text.
     """
     try:
-        messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
+        messages = request.model_dump(include={"messages"})["messages"]
         
         response = await generate_debate_response(
             messages=messages,
@@ -163,22 +170,29 @@ async def tts_generate(request: TTSRequest):
     - elevenlabs: MP3 format
     """
     try:
-        audio_bytes = await generate_tts(
+        provider = request.provider or get_settings().tts_provider
+        audio = await generate_tts(
             text=request.text,
             voice_id=request.voice_id,
-            provider=request.provider
+            provider=provider
         )
         
-        # Determine content type based on provider
-        content_type = "audio/mpeg" if request.provider == "elevenlabs" else "audio/wav"
+        if provider == "elevenlabs":
+            media_type, disposition = _AUDIO_FORMATS["elevenlabs"]
+            # Stream MP3 chunks through as ElevenLabs produces them
+            return StreamingResponse(
+                audio,
+                media_type=media_type,
+                headers={"Content-Disposition": disposition}
+            )
         
+        media_type, disposition = _AUDIO_FORMATS["pyttsx3"]
         return Response(
-            content=audio_bytes,
-            media_type=content_type,
+            content=audio,
+            media_type=media_type,
             headers={
-                "Content-Disposition": "attachment; filename=audio.{}".format(
-                    "mp3" if request.provider == "elevenlabs" else "wav"
-                )
+                "Content-Disposition": disposition,
+                "Content-Length": str(len(audio))
             }
         )
     
@@ -187,11 +201,13 @@ async def tts_generate(request: TTSRequest):
 
 
 @app.get("/api/tts/voices")
-async def tts_voices():
+def tts_voices():
     """
     Get available TTS voices.
     
     Returns list of voice objects with id and name.
+    Declared sync so FastAPI runs it in its threadpool; the pyttsx3
+    voice lookup may block on the engine lock during synthesis.
     """
     try:
         voices = get_available_voices()
@@ -204,4 +220,12 @@ async def tts_voices():
 if __name__ == "__main__":
     import uvicorn
     settings = get_settings()
-    uvicorn.run(app, host=settings.host, port=settings.port)
+    uvicorn.run(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        # uvloop is not available on Windows; uvicorn falls back to asyncio there
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=settings.workers
+    )
@@ -5,10 +5,11 @@ Loads environment variables and provides settings for the application.
 
 import json
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import List
 
 from dotenv import load_dotenv
+from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings
 
 # Load environment variables from .env file
@@ -19,26 +20,44 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
     # DeepSeek API Configuration
-    deepseek_api_key: str = os.getenv("DEEPSEEK_API_KEY", "")
+    deepseek_api_key: str = ""
     deepseek_base_url: str = "https://api.deepseek.com"
     deepseek_model: str = "deepseek-chat"
+    deepseek_request_timeout: float = 30.0  # Seconds per non-streaming attempt
+    
+    # Streaming Configuration
+    # Tokens are coalesced into one SSE frame per batch or per interval
+    debate_stream_batch: int = Field(default=8, ge=1)
+    debate_stream_interval_ms: int = Field(default=50, ge=1)
     
     # ElevenLabs API Configuration (optional)
-    elevenlabs_api_key: str = os.getenv("ELEVENLABS_API_KEY", "")
+    elevenlabs_api_key: str = ""
     
     # TTS Provider Configuration
-    tts_provider: str = os.getenv("TTS_PROVIDER", "pyttsx3")
+    tts_provider: str = "pyttsx3"
+    tts_concurrency: int = Field(default=2, ge=1)  # Max pyttsx3 syntheses in flight
     
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
+    workers: int = Field(
+        default=1, validation_alias=AliasChoices("workers", "WEB_CONCURRENCY")
+    )
     
     # Debug Configuration
-    debug: bool = os.getenv("DEBUG", "false").lower() == "true"
+    debug: bool = False
+    
+    @field_validator("debug", mode="before")
+    @classmethod
+    def parse_debug(cls, value):
+        """Treat any DEBUG value other than "true" as False."""
+        if isinstance(value, str):
+            return value.lower() == "true"
+        return value
     
-    @property
+    @cached_property
     def cors_origins(self) -> List[str]:
-        """Parse CORS origins from environment variable."""
+        """Parse CORS origins from environment variable (once per instance)."""
         origins_str = os.getenv("CORS_ORIGINS", '["http://localhost:5173"]')
         try:
             return json.loads(origins_str)
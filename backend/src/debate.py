@@ -3,10 +3,13 @@ Debate module for handling LLM streaming via DeepSeek API.
 Provides functions for streaming debate responses using Server-Sent Events (SSE).
 """
 
-import json
+import asyncio
 import logging
+from functools import lru_cache
 from typing import AsyncGenerator, List, Optional
 
+import httpx
+import orjson
 from openai import AsyncOpenAI
 
 from .config import get_settings
@@ -14,12 +17,48 @@ from .config import get_settings
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Static SSE frames, serialized once at import
+_SSE_DONE = b'data: {"done":true}\n\n'
+_SSE_NO_KEY = b'data: {"error":"DeepSeek API key not configured","done":true}\n\n'
+
+
+def _content_frame(parts: List[str]) -> bytes:
+    """Build one SSE content frame from buffered tokens."""
+    return b"data: " + orjson.dumps({"content": "".join(parts), "done": False}) + b"\n\n"
+
+
+@lru_cache(maxsize=1)
+def _client() -> AsyncOpenAI:
+    """
+    Get the shared DeepSeek client (OpenAI-compatible).
+
+    The client is created once per process so its HTTP connection pool
+    and keep-alive connections are reused across requests.
+    """
+    settings = get_settings()
+    return AsyncOpenAI(
+        api_key=settings.deepseek_api_key,
+        base_url=settings.deepseek_base_url,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    )
+
+
+async def close_client() -> None:
+    """Close the shared DeepSeek client if it was created."""
+    if _client.cache_info().currsize:
+        await _client().close()
+        _client.cache_clear()
+
 
 async def stream_debate_response(
     messages: List[dict],
     model: Optional[str] = None,
     temperature: float = 0.7
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Stream debate responses from DeepSeek API using SSE format.
     
@@ -29,7 +68,7 @@ async def stream_debate_response(
         temperature: Sampling temperature (0.0 to 2.0)
     
     Yields:
-        SSE-formatted data chunks as strings
+        SSE-formatted data chunks as UTF-8 bytes
     
     Example:
         messages = [
@@ -37,19 +76,16 @@ async def stream_debate_response(
             {"role": "user", "content": "Argue for this motion..."}
         ]
         async for chunk in stream_debate_response(messages):
-            print(chunk)  # "data: {\"content\": \"...\"}\n\n"
+            print(chunk)  # b'data: {"content":"...","done":false}\n\n'
     """
     settings = get_settings()
     
     if not settings.deepseek_api_key:
-        yield f"data: {json.dumps({'error': 'DeepSeek API key not configured'})}\n\n"
+        yield _SSE_NO_KEY
         return
     
-    # Initialize DeepSeek client (OpenAI-compatible)
-    client = AsyncOpenAI(
-        api_key=settings.deepseek_api_key,
-        base_url=settings.deepseek_base_url
-    )
+    client = _client()
+    buf: List[str] = []
     
     try:
         # Debug logging
@@ -72,17 +108,26 @@ async def stream_debate_response(
             stream=True
         )
         
-        # Stream chunks as SSE
+        # Stream chunks as SSE, coalescing tokens into batched frames
+        loop = asyncio.get_running_loop()
+        batch_size = settings.debate_stream_batch
+        interval = settings.debate_stream_interval_ms / 1000
         full_response = ""
+        last_flush = loop.time()
         async for chunk in stream:
             if chunk.choices and chunk.choices[0].delta.content:
                 content = chunk.choices[0].delta.content
                 full_response += content
-                data = {
-                    "content": content,
-                    "done": False
-                }
-                yield f"data: {json.dumps(data)}\n\n"
+                buf.append(content)
+                now = loop.time()
+                if len(buf) >= batch_size or now - last_flush >= interval:
+                    yield _content_frame(buf)
+                    buf.clear()
+                    last_flush = now
+        
+        # Flush any tokens still buffered
+        if buf:
+            yield _content_frame(buf)
         
         # Debug logging for complete response
         if settings.debug:
@@ -94,11 +139,13 @@ async def stream_debate_response(
             logger.debug("=" * 80)
         
         # Send final done message
-        yield f"data: {json.dumps({'done': True})}\n\n"
+        yield _SSE_DONE
         
     except Exception as e:
-        error_data = {"error": str(e), "done": True}
-        yield f"data: {json.dumps(error_data)}\n\n"
+        # Deliver tokens already received before reporting the failure
+        if buf:
+            yield _content_frame(buf)
+        yield b"data: " + orjson.dumps({"error": str(e), "done": True}) + b"\n\n"
 
 
 async def generate_debate_response(
@@ -134,17 +181,29 @@ async def generate_debate_response(
             logger.debug(f"  [{i}] {msg['role']}: {msg['content'][:200]}...")
         logger.debug("=" * 80)
     
-    client = AsyncOpenAI(
-        api_key=settings.deepseek_api_key,
-        base_url=settings.deepseek_base_url
-    )
+    client = _client()
     
-    response = await client.chat.completions.create(
-        model=model or settings.deepseek_model,
-        messages=messages,
-        temperature=temperature,
-        stream=False
-    )
+    # Cut off slow tail-latency requests and retry once
+    for attempt in range(2):
+        try:
+            response = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model=model or settings.deepseek_model,
+                    messages=messages,
+                    temperature=temperature,
+                    stream=False
+                ),
+                timeout=settings.deepseek_request_timeout
+            )
+            break
+        except asyncio.TimeoutError as e:
+            if attempt:
+                raise TimeoutError(
+                    f"DeepSeek request timed out after {settings.deepseek_request_timeout}s"
+                ) from e
+            logger.warning(
+                f"DeepSeek request timed out after {settings.deepseek_request_timeout}s, retrying"
+            )
     
     content = response.choices[0].message.content
     
@@ -3,17 +3,100 @@ TTS (Text-to-Speech) module for generating audio from text.
 Supports both local pyttsx3 and ElevenLabs API.
 """
 
+import asyncio
+import hashlib
 import os
 import tempfile
-import wave
 import struct
-from typing import Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Union
 from pathlib import Path
 
 import httpx
 
 from .config import get_settings
 
+# Common ElevenLabs voices, built once at import
+_ELEVENLABS_VOICES = (
+    {"id": "pNInz6obpgDQGcFmaJgB", "name": "Adam"},
+    {"id": "IKne3meq5aSn9XLyUdCD", "name": "Charlie"},
+    {"id": "EXAVITQu4vr4xnSDxMaL", "name": "Bella"},
+    {"id": "MF3mGyEYCl7XYWbV9V6O", "name": "Elli"},
+    {"id": "TxGEqnHWrfWFTfGW9XjX", "name": "Josh"},
+)
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for ElevenLabs requests.
+
+    Reusing one client keeps connections to api.elevenlabs.io alive
+    between TTS requests instead of reconnecting every time.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20)
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared ElevenLabs HTTP client if it was created."""
+    if _http_client.cache_info().currsize:
+        await _http_client().aclose()
+        _http_client.cache_clear()
+
+
+# Scratch directory for pyttsx3 output; /dev/shm is RAM-backed on Linux
+_TTS_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+# pyttsx3 engines are not thread-safe; hold this around every engine call
+_engine_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _tts_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding concurrent pyttsx3 requests.
+
+    Requests beyond the limit wait on the event loop instead of each
+    occupying an executor thread while blocked on _engine_lock.
+    """
+    return asyncio.Semaphore(get_settings().tts_concurrency)
+
+
+@lru_cache(maxsize=1)
+def _engine():
+    """
+    Get the shared pyttsx3 engine.
+
+    Initializing pyttsx3 loads the platform speech driver, so the engine
+    is created once and reused. Failed initializations are not cached.
+    Callers must hold _engine_lock.
+    """
+    import pyttsx3
+    
+    engine = pyttsx3.init()
+    
+    # Set properties for good quality
+    engine.setProperty('rate', 175)  # Speaking rate
+    engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def _pyttsx3_voices() -> tuple:
+    """Get the pyttsx3 voice list, queried from the driver only once."""
+    with _engine_lock:
+        voices = _engine().getProperty('voices')
+    return tuple(
+        {"id": str(i), "name": voice.name}
+        for i, voice in enumerate(voices)
+    )
+
 
 def generate_tts_pyttsx3(text: str) -> bytes:
     """
@@ -26,23 +109,16 @@ def generate_tts_pyttsx3(text: str) -> bytes:
         Audio bytes (WAV format)
     """
     try:
-        import pyttsx3
-        
-        # Initialize TTS engine
-        engine = pyttsx3.init()
-        
-        # Set properties for good quality
-        engine.setProperty('rate', 175)  # Speaking rate
-        engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
-        
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp_file:
-            tmp_path = tmp_file.name
+        # Create temporary file with a random name (O_EXCL, mode 0600)
+        fd, tmp_path = tempfile.mkstemp(dir=_TTS_TMP_DIR, suffix='.wav')
+        os.close(fd)
         
         try:
             # Save to file
-            engine.save_to_file(text, tmp_path)
-            engine.runAndWait()
+            with _engine_lock:
+                engine = _engine()
+                engine.save_to_file(text, tmp_path)
+                engine.runAndWait()
             
             # Read the audio file
             with open(tmp_path, 'rb') as f:
@@ -57,7 +133,7 @@ def generate_tts_pyttsx3(text: str) -> bytes:
         # Fallback: generate a simple silent/sine wave WAV file
         # This allows the API to return successfully even if TTS fails
         print(f"TTS error (using fallback): {e}")
-        return generate_silent_wav(2)  # 2 seconds of silence
+        return _FALLBACK_WAV
 
 
 def generate_silent_wav(duration_seconds: float = 2.0) -> bytes:
@@ -75,32 +151,37 @@ def generate_silent_wav(duration_seconds: float = 2.0) -> bytes:
     num_channels = 1
     sample_width = 2  # 16-bit
     
-    # Calculate number of frames
+    # Calculate data size; silence is all zero bytes
     num_frames = int(sample_rate * duration_seconds)
+    data_size = num_frames * num_channels * sample_width
     
-    # Create silent audio data (all zeros)
-    audio_data = struct.pack('<' + 'h' * num_frames, *([0] * num_frames))
-    
-    # Create WAV file in memory
-    import io
-    wav_buffer = io.BytesIO()
+    # Canonical 44-byte RIFF/WAVE header for 16-bit PCM
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, num_channels, sample_rate,
+        sample_rate * num_channels * sample_width,
+        num_channels * sample_width, sample_width * 8,
+        b'data', data_size
+    )
     
-    with wave.open(wav_buffer, 'wb') as wav_file:
-        wav_file.setnchannels(num_channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_data)
-    
-    return wav_buffer.getvalue()
+    return header + bytes(data_size)
+
+
+# 2 seconds of silence, returned whenever pyttsx3 fails
+_FALLBACK_WAV = generate_silent_wav(2)
 
 
 async def generate_tts_elevenlabs(
     text: str,
     voice_id: Optional[str] = None,
     api_key: Optional[str] = None
-) -> bytes:
+) -> AsyncIterator[bytes]:
     """
-    Generate TTS audio using ElevenLabs API.
+    Generate TTS audio using the ElevenLabs streaming API.
+    
+    The request is sent and its status checked before returning, so
+    configuration and HTTP errors raise here rather than mid-stream.
     
     Args:
         text: Text to convert to speech
@@ -108,7 +189,7 @@ async def generate_tts_elevenlabs(
         api_key: ElevenLabs API key (defaults to env var)
     
     Returns:
-        Audio bytes (MP3 format)
+        Async iterator of audio chunks (MP3 format) as they arrive
     """
     settings = get_settings()
     api_key = api_key or settings.elevenlabs_api_key
@@ -118,7 +199,7 @@ async def generate_tts_elevenlabs(
     
     voice_id = voice_id or "pNInz6obpgDQGcFmaJgB"  # Adam voice
     
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
     
     headers = {
         "Accept": "audio/mpeg",
@@ -135,17 +216,91 @@ async def generate_tts_elevenlabs(
         }
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=data, headers=headers)
+    client = _http_client()
+    response = await client.send(
+        client.build_request("POST", url, json=data, headers=headers),
+        stream=True
+    )
+    try:
         response.raise_for_status()
-        return response.content
+    except httpx.HTTPStatusError:
+        await response.aclose()
+        raise
+    
+    return _iter_audio_chunks(response)
+
+
+async def _iter_audio_chunks(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield a streamed response body in chunks, closing it when done."""
+    try:
+        async for chunk in response.aiter_bytes(chunk_size=4096):
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+# LRU cache of generated audio, bounded by entry count and total size.
+# Only touched from the event loop, so no locking is needed.
+_TTS_CACHE_MAX_ENTRIES = 256
+_TTS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_tts_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_tts_cache_bytes = 0
+
+
+def _tts_cache_key(provider: str, voice_id: Optional[str], text: str) -> tuple:
+    """Build a cache key without holding on to the full text."""
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return (provider, voice_id, digest)
+
+
+def _tts_cache_get(key: tuple) -> Optional[bytes]:
+    """Look up cached audio, marking it as most recently used."""
+    audio = _tts_cache.get(key)
+    if audio is not None:
+        _tts_cache.move_to_end(key)
+    return audio
+
+
+def _tts_cache_put(key: tuple, audio: bytes) -> None:
+    """Store audio, evicting least recently used entries over the limits."""
+    global _tts_cache_bytes
+    
+    if key in _tts_cache or len(audio) > _TTS_CACHE_MAX_BYTES:
+        return
+    
+    _tts_cache[key] = audio
+    _tts_cache_bytes += len(audio)
+    while (
+        len(_tts_cache) > _TTS_CACHE_MAX_ENTRIES
+        or _tts_cache_bytes > _TTS_CACHE_MAX_BYTES
+    ):
+        _, evicted = _tts_cache.popitem(last=False)
+        _tts_cache_bytes -= len(evicted)
+
+
+async def _iter_cached(audio: bytes) -> AsyncIterator[bytes]:
+    """Yield cached audio as a single chunk."""
+    yield audio
+
+
+async def _cache_stream(key: tuple, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Pass chunks through, caching the audio once the stream completes."""
+    parts = []
+    try:
+        async for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+    finally:
+        await chunks.aclose()
+    
+    _tts_cache_put(key, b"".join(parts))
 
 
 async def generate_tts(
     text: str,
     voice_id: Optional[str] = None,
     provider: Optional[str] = None
-) -> bytes:
+) -> Union[bytes, AsyncIterator[bytes]]:
     """
     Generate TTS audio using configured provider.
     
@@ -155,16 +310,36 @@ async def generate_tts(
         provider: TTS provider ('pyttsx3' or 'elevenlabs'), defaults to env setting
     
     Returns:
-        Audio bytes
+        Async iterator of MP3 chunks for ElevenLabs, WAV bytes for pyttsx3
+    
+    Repeated requests for the same text and voice are served from an
+    in-memory LRU cache.
     """
     settings = get_settings()
     provider = provider or settings.tts_provider
     
     if provider == "elevenlabs":
-        return await generate_tts_elevenlabs(text, voice_id)
+        key = _tts_cache_key(provider, voice_id, text)
+        cached = _tts_cache_get(key)
+        if cached is not None:
+            return _iter_cached(cached)
+        return _cache_stream(key, await generate_tts_elevenlabs(text, voice_id))
     else:
-        # Default to pyttsx3
-        return generate_tts_pyttsx3(text)
+        # pyttsx3 ignores voice_id, so leave it out of the key
+        key = _tts_cache_key(provider, None, text)
+        cached = _tts_cache_get(key)
+        if cached is not None:
+            return cached
+        
+        # Default to pyttsx3; synthesis blocks, so run it off the event loop
+        loop = asyncio.get_running_loop()
+        async with _tts_semaphore():
+            audio = await loop.run_in_executor(None, generate_tts_pyttsx3, text)
+        
+        # Don't cache empty output or the silent fallback from a failed synthesis
+        if audio and audio is not _FALLBACK_WAV:
+            _tts_cache_put(key, audio)
+        return audio
 
 
 def get_available_voices() -> list:
@@ -178,23 +353,11 @@ def get_available_voices() -> list:
     
     if settings.tts_provider == "elevenlabs":
         # Return common ElevenLabs voices
-        return [
-            {"id": "pNInz6obpgDQGcFmaJgB", "name": "Adam"},
-            {"id": "IKne3meq5aSn9XLyUdCD", "name": "Charlie"},
-            {"id": "EXAVITQu4vr4xnSDxMaL", "name": "Bella"},
-            {"id": "MF3mGyEYCl7XYWbV9V6O", "name": "Elli"},
-            {"id": "TxGEqnHWrfWFTfGW9XjX", "name": "Josh"}
-        ]
+        return list(_ELEVENLABS_VOICES)
     else:
         # pyttsx3 voices - wrap in try/except
         try:
-            import pyttsx3
-            engine = pyttsx3.init()
-            voices = engine.getProperty('voices')
-            return [
-                {"id": str(i), "name": voice.name}
-                for i, voice in enumerate(voices)
-            ]
+            return list(_pyttsx3_voices())
         except Exception as e:
             print(f"Error getting pyttsx3 voices: {e}")
             # Return default voice